@@ -0,0 +1,45 @@
+"""
+Generate the packaged deployment JSON Schema from the Pydantic models.
+
+This describes what the Python SDK validates, which is a subset of the
+canonical schema/deployment/deployment.schema.json generated from Go types.
+
+It must be run with the pydantic release pinned in
+multi_agent_spec.models._SCHEMA_PYDANTIC_VERSION; bump that constant when
+regenerating with a newer pydantic.
+
+Usage: python scripts/gen_schema.py
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pydantic
+
+from multi_agent_spec import Deployment
+from multi_agent_spec.models import _SCHEMA_PYDANTIC_VERSION
+
+OUTPUT = (
+    Path(__file__).resolve().parent.parent
+    / "src"
+    / "multi_agent_spec"
+    / "pydantic-deployment.schema.json"
+)
+
+
+def main() -> None:
+    if pydantic.VERSION != _SCHEMA_PYDANTIC_VERSION:
+        sys.exit(
+            f"pydantic {_SCHEMA_PYDANTIC_VERSION} is required to generate the "
+            f"schema, found {pydantic.VERSION}"
+        )
+    schema = Deployment.model_json_schema()
+    OUTPUT.write_text(json.dumps(schema, indent=2) + "\n")
+    print(f"Wrote {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
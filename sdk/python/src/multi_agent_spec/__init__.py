@@ -23,34 +23,81 @@ Example:
 
 __version__ = "1.0.0"
 
-from multi_agent_spec.models import (
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from multi_agent_spec.models import (
+        # Enums
+        Model,
+        Platform,
+        Priority,
+        Tool,
+        WorkflowType,
+        # Agent models
+        Agent,
+        # Team/Orchestration models
+        Step,
+        Team,
+        Workflow,
+        # Deployment models
+        AgentKitLocalConfig,
+        AwsAgentCoreConfig,
+        ClaudeCodeConfig,
+        Deployment,
+        KiroCliConfig,
+        KubernetesConfig,
+        PlatformConfig,
+        ResourceLimits,
+        Target,
+        build,
+        deployment_schema,
+        dump_config_json,
+        validate_agents,
+        validate_targets,
+        # Mappings
+        BEDROCK_MODELS,
+        CLAUDE_CODE_MODELS,
+        KIRO_CLI_MODELS,
+        KIRO_CLI_TOOLS,
+    )
+
+# Public names are resolved lazily (PEP 562) so that importing the package does
+# not pay for building every Pydantic model up front.
+_LAZY: dict[str, str] = {
     # Enums
-    Model,
-    Platform,
-    Priority,
-    Tool,
-    WorkflowType,
+    "Model": "models",
+    "Platform": "models",
+    "Priority": "models",
+    "Tool": "models",
+    "WorkflowType": "models",
     # Agent models
-    Agent,
+    "Agent": "models",
     # Team/Orchestration models
-    Step,
-    Team,
-    Workflow,
+    "Step": "models",
+    "Team": "models",
+    "Workflow": "models",
     # Deployment models
-    AgentKitLocalConfig,
-    AwsAgentCoreConfig,
-    ClaudeCodeConfig,
-    Deployment,
-    KiroCliConfig,
-    KubernetesConfig,
-    ResourceLimits,
-    Target,
+    "AgentKitLocalConfig": "models",
+    "AwsAgentCoreConfig": "models",
+    "ClaudeCodeConfig": "models",
+    "Deployment": "models",
+    "KiroCliConfig": "models",
+    "KubernetesConfig": "models",
+    "PlatformConfig": "models",
+    "ResourceLimits": "models",
+    "Target": "models",
+    "build": "models",
+    "deployment_schema": "models",
+    "dump_config_json": "models",
+    "validate_agents": "models",
+    "validate_targets": "models",
     # Mappings
-    BEDROCK_MODELS,
-    CLAUDE_CODE_MODELS,
-    KIRO_CLI_MODELS,
-    KIRO_CLI_TOOLS,
-)
+    "BEDROCK_MODELS": "models",
+    "CLAUDE_CODE_MODELS": "models",
+    "KIRO_CLI_MODELS": "models",
+    "KIRO_CLI_TOOLS": "models",
+}
 
 __all__ = [
     # Version
@@ -74,11 +121,33 @@ __all__ = [
     "ResourceLimits",
     "KubernetesConfig",
     "AgentKitLocalConfig",
+    "PlatformConfig",
     "Target",
     "Deployment",
+    "build",
+    "deployment_schema",
+    "dump_config_json",
+    "validate_agents",
+    "validate_targets",
     # Mappings
     "CLAUDE_CODE_MODELS",
     "KIRO_CLI_MODELS",
     "BEDROCK_MODELS",
     "KIRO_CLI_TOOLS",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
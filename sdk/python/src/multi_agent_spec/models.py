@@ -17,10 +17,72 @@ Example:
 
 from __future__ import annotations
 
+import functools
+import re
+import sys
+from collections import deque
+from collections.abc import Iterable, Mapping
 from enum import Enum
-from typing import Literal
+from importlib import resources
+from types import MappingProxyType
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    Field,
+    TypeAdapter,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
+
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:  # pragma: no cover - Python 3.10
+
+    class StrEnum(str, Enum):
+        """Backport of :class:`enum.StrEnum` for Python 3.10."""
+
+        def __str__(self) -> str:
+            return str(self.value)
+
+        def __format__(self, format_spec: str) -> str:
+            return str(self.value).__format__(format_spec)
+
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None  # type: ignore[assignment]
+
+# Identifier patterns are ASCII-only, so they are compiled once here and shared
+# by every model instead of being compiled into each field's core schema.
+_NAME_RE = re.compile(r"^[a-z][a-z0-9-]*\Z", re.ASCII)
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+\Z", re.ASCII)
+
+
+def _duplicates(values: Iterable[str]) -> list[str]:
+    seen: set[str] = set()
+    duplicates: dict[str, None] = {}
+    for value in values:
+        if value in seen:
+            duplicates[value] = None
+        seen.add(value)
+    return list(duplicates)
+
+
+def _unique_tools(tools: Iterable[str]) -> tuple[str, ...]:
+    # Drop repeated tools, keeping first-seen order.
+    return tuple(dict.fromkeys(tools))
+
+
+def _check_name(value: str) -> str:
+    if not _NAME_RE.match(value):
+        raise ValueError(
+            "must start with a lowercase letter and contain only lowercase "
+            "letters, digits and hyphens"
+        )
+    return value
 
 
 # =============================================================================
@@ -28,7 +90,7 @@ from pydantic import BaseModel, Field
 # =============================================================================
 
 
-class Tool(str, Enum):
+class Tool(StrEnum):
     """Canonical tool names available to agents."""
 
     WEB_SEARCH = "WebSearch"
@@ -42,7 +104,7 @@ class Tool(str, Enum):
     TASK = "Task"
 
 
-class Model(str, Enum):
+class Model(StrEnum):
     """Model capability tiers."""
 
     HAIKU = "haiku"
@@ -50,7 +112,7 @@ class Model(str, Enum):
     OPUS = "opus"
 
 
-class WorkflowType(str, Enum):
+class WorkflowType(StrEnum):
     """Workflow execution patterns."""
 
     SEQUENTIAL = "sequential"
@@ -59,7 +121,7 @@ class WorkflowType(str, Enum):
     ORCHESTRATED = "orchestrated"
 
 
-class Platform(str, Enum):
+class Platform(StrEnum):
     """Supported deployment platforms."""
 
     CLAUDE_CODE = "claude-code"
@@ -73,7 +135,7 @@ class Platform(str, Enum):
     AGENTKIT_LOCAL = "agentkit-local"
 
 
-class Priority(str, Enum):
+class Priority(StrEnum):
     """Deployment priority levels."""
 
     P1 = "p1"
@@ -91,8 +153,8 @@ class Agent(BaseModel):
 
     name: str = Field(
         ...,
-        pattern=r"^[a-z][a-z0-9-]*$",
         description="Unique identifier for the agent (lowercase, hyphenated)",
+        json_schema_extra={"pattern": r"^[a-z][a-z0-9-]*$"},
     )
     description: str = Field(
         ..., description="Brief description of the agent's purpose and capabilities"
@@ -101,21 +163,57 @@ class Agent(BaseModel):
         default=Model.SONNET,
         description="Model capability tier (mapped to platform-specific models)",
     )
-    tools: list[str] = Field(
-        default_factory=list, description="List of tools the agent can use"
+    tools: tuple[str, ...] = Field(
+        default=(), description="List of tools the agent can use"
     )
-    skills: list[str] = Field(
-        default_factory=list, description="List of skills the agent can invoke"
+    skills: tuple[str, ...] = Field(
+        default=(), description="List of skills the agent can invoke"
     )
-    dependencies: list[str] = Field(
-        default_factory=list,
+    dependencies: tuple[str, ...] = Field(
+        default=(),
         description="Other agents this agent depends on or can spawn",
     )
     instructions: str | None = Field(
         default=None, description="System prompt / instructions for the agent"
     )
 
-    model_config = {"use_enum_values": True}
+    model_config = {"use_enum_values": True, "defer_build": True}
+
+    @field_validator("name")
+    @classmethod
+    def _validate_name(cls, value: str) -> str:
+        return _check_name(value)
+
+    @field_validator("tools")
+    @classmethod
+    def _dedupe_tools(cls, value: tuple[str, ...]) -> tuple[str, ...]:
+        return _unique_tools(value)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact JSON, using orjson when it is installed.
+
+        Produces the same document as ``model_dump_json()``.
+        """
+        if _orjson is None:
+            return self.model_dump_json().encode()
+        return _orjson.dumps(self.__dict__)
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> Agent:
+        """Build an agent from already-validated data without re-validating.
+
+        Intended for cache reloads and storage round-trips of data that was
+        produced by ``model_dump()`` or decoded from ``model_dump_json()``.
+        Sequence fields are converted back to tuples and repeated tools are
+        dropped. Never use this for user-supplied input.
+        """
+        data = dict(data)
+        for key in ("skills", "dependencies"):
+            if key in data:
+                data[key] = tuple(data[key])
+        if "tools" in data:
+            data["tools"] = _unique_tools(data["tools"])
+        return cls.model_construct(**data)
 
 
 # =============================================================================
@@ -138,6 +236,8 @@ class Step(BaseModel):
         default=None, description="Named outputs from this step"
     )
 
+    model_config = {"defer_build": True}
+
 
 class Workflow(BaseModel):
     """Workflow definition."""
@@ -149,7 +249,63 @@ class Workflow(BaseModel):
         default=None, description="Ordered steps in the workflow"
     )
 
-    model_config = {"use_enum_values": True}
+    model_config = {"use_enum_values": True, "defer_build": True}
+
+    def to_soa(self) -> tuple[list[str], list[str], list[list[str] | None]]:
+        """Return the steps as parallel name, agent and depends_on lists.
+
+        The lists share one index per step, which suits batch traversals such
+        as dependency resolution over large workflows.
+        """
+        steps = self.steps or []
+        return (
+            [step.name for step in steps],
+            [step.agent for step in steps],
+            [step.depends_on for step in steps],
+        )
+
+    def validate_dag(self) -> list[str]:
+        """Check step dependencies and return step names in execution order.
+
+        Steps are ordered with Kahn's algorithm; steps that become ready at the
+        same time keep their declaration order.
+
+        Raises:
+            ValueError: If step names repeat, a step depends on an unknown
+                step, or the dependencies contain a cycle.
+        """
+        names, _, depends_on = self.to_soa()
+        duplicates = _duplicates(names)
+        if duplicates:
+            raise ValueError(f"duplicate step names: {duplicates}")
+        index = {name: i for i, name in enumerate(names)}
+        in_degree = [0] * len(names)
+        downstream: list[list[int]] = [[] for _ in names]
+        for i, deps in enumerate(depends_on):
+            for dep in deps or ():
+                j = index.get(dep)
+                if j is None:
+                    raise ValueError(
+                        f"step {names[i]!r} depends on unknown step {dep!r}"
+                    )
+                downstream[j].append(i)
+                in_degree[i] += 1
+
+        ready = deque(i for i, degree in enumerate(in_degree) if degree == 0)
+        order: list[str] = []
+        while ready:
+            i = ready.popleft()
+            order.append(names[i])
+            for j in downstream[i]:
+                in_degree[j] -= 1
+                if in_degree[j] == 0:
+                    ready.append(j)
+
+        if len(order) != len(names):
+            # Includes steps that only depend on a cycle, not just its members.
+            blocked = [name for i, name in enumerate(names) if in_degree[i] > 0]
+            raise ValueError(f"steps blocked by a dependency cycle: {blocked}")
+        return order
 
 
 class Team(BaseModel):
@@ -157,13 +313,13 @@ class Team(BaseModel):
 
     name: str = Field(
         ...,
-        pattern=r"^[a-z][a-z0-9-]*$",
         description="Team identifier (e.g., stats-agent-team)",
+        json_schema_extra={"pattern": r"^[a-z][a-z0-9-]*$"},
     )
     version: str = Field(
         ...,
-        pattern=r"^\d+\.\d+\.\d+$",
         description="Semantic version of the team definition",
+        json_schema_extra={"pattern": r"^\d+\.\d+\.\d+$"},
     )
     description: str | None = Field(
         default=None, description="Brief description of the team's purpose"
@@ -182,27 +338,113 @@ class Team(BaseModel):
         description="Shared context or background information for all agents",
     )
 
+    model_config = {"defer_build": True}
+
+    @field_validator("name")
+    @classmethod
+    def _validate_name(cls, value: str) -> str:
+        return _check_name(value)
+
+    @field_validator("version")
+    @classmethod
+    def _validate_version(cls, value: str) -> str:
+        if not _SEMVER_RE.match(value):
+            raise ValueError("must be a semantic version (MAJOR.MINOR.PATCH)")
+        return value
+
+    @model_validator(mode="after")
+    def _check_unique_agents(self) -> Team:
+        duplicates = _duplicates(self.agents)
+        if duplicates:
+            raise ValueError(f"duplicate agent names: {duplicates}")
+        return self
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact JSON, using orjson when it is installed.
+
+        Produces the same document as ``model_dump_json()``.
+        """
+        if _orjson is None:
+            return self.model_dump_json().encode()
+        data = dict(self.__dict__)
+        if self.workflow is not None:
+            workflow = dict(self.workflow.__dict__)
+            if self.workflow.steps is not None:
+                workflow["steps"] = [step.__dict__ for step in self.workflow.steps]
+            data["workflow"] = workflow
+        return _orjson.dumps(data)
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> Team:
+        """Build a team from already-validated data without re-validating.
+
+        Nested workflow steps are constructed the same way. Never use this
+        for user-supplied input.
+        """
+        data = dict(data)
+        workflow = data.get("workflow")
+        if isinstance(workflow, dict):
+            workflow = dict(workflow)
+            steps = workflow.get("steps")
+            if steps is not None:
+                workflow["steps"] = [
+                    Step.model_construct(**s) if isinstance(s, dict) else s
+                    for s in steps
+                ]
+            data["workflow"] = Workflow.model_construct(**workflow)
+        return cls.model_construct(**data)
+
 
 # =============================================================================
 # Deployment Models
 # =============================================================================
 
 
-class ClaudeCodeConfig(BaseModel):
+class _PlatformConfigModel(BaseModel):
+    """Base for platform configuration models.
+
+    Configs accept field names as well as their camelCase aliases, and keep
+    keys they do not model, so no part of a deployment file is dropped. This
+    is looser than the canonical deployment schema, which sets
+    ``additionalProperties: false`` on every platform config.
+    """
+
+    model_config = {
+        "defer_build": True,
+        "populate_by_name": True,
+        "extra": "allow",
+    }
+
+
+class ClaudeCodeConfig(_PlatformConfigModel):
     """Claude Code platform configuration."""
 
     agent_dir: str = Field(default=".claude/agents", alias="agentDir")
-    format: Literal["markdown"] = "markdown"
+    format: str = Field(default="markdown", frozen=True)
+
+    @field_validator("format")
+    @classmethod
+    def _validate_format(cls, value: str) -> str:
+        if value != "markdown":
+            raise ValueError("format must be 'markdown'")
+        return value
 
 
-class KiroCliConfig(BaseModel):
+class KiroCliConfig(_PlatformConfigModel):
     """Kiro CLI platform configuration."""
 
     plugin_dir: str = Field(default="plugins/kiro/agents", alias="pluginDir")
-    format: Literal["json"] = "json"
+    format: str = Field(default="json", frozen=True)
 
+    @field_validator("format")
+    @classmethod
+    def _validate_format(cls, value: str) -> str:
+        if value != "json":
+            raise ValueError("format must be 'json'")
+        return value
 
-class AwsAgentCoreConfig(BaseModel):
+
+class AwsAgentCoreConfig(_PlatformConfigModel):
     """AWS AgentCore platform configuration."""
 
     region: str = "us-east-1"
@@ -213,14 +455,14 @@ class AwsAgentCoreConfig(BaseModel):
     lambda_runtime: str = Field(default="python3.11", alias="lambdaRuntime")
 
 
-class ResourceLimits(BaseModel):
+class ResourceLimits(_PlatformConfigModel):
     """Kubernetes resource limits."""
 
     cpu: str = "500m"
     memory: str = "512Mi"
 
 
-class KubernetesConfig(BaseModel):
+class KubernetesConfig(_PlatformConfigModel):
     """Kubernetes platform configuration."""
 
     namespace: str = "multi-agent"
@@ -231,13 +473,45 @@ class KubernetesConfig(BaseModel):
     )
 
 
-class AgentKitLocalConfig(BaseModel):
+class AgentKitLocalConfig(_PlatformConfigModel):
     """AgentKit local platform configuration."""
 
     transport: Literal["stdio", "http"] = "stdio"
     port: int | None = None
 
 
+PlatformConfig = (
+    ClaudeCodeConfig
+    | KiroCliConfig
+    | AwsAgentCoreConfig
+    | KubernetesConfig
+    | AgentKitLocalConfig
+)
+"""Typed configuration for the platforms that have a dedicated config model."""
+
+_PLATFORM_CONFIGS: Mapping[str, type[PlatformConfig]] = MappingProxyType({
+    Platform.CLAUDE_CODE.value: ClaudeCodeConfig,
+    Platform.KIRO_CLI.value: KiroCliConfig,
+    Platform.AWS_AGENTCORE.value: AwsAgentCoreConfig,
+    Platform.AWS_EKS.value: KubernetesConfig,
+    Platform.AZURE_AKS.value: KubernetesConfig,
+    Platform.GCP_GKE.value: KubernetesConfig,
+    Platform.KUBERNETES.value: KubernetesConfig,
+    Platform.AGENTKIT_LOCAL.value: AgentKitLocalConfig,
+})
+
+
+def _construct_config(
+    config_cls: type[PlatformConfig], data: dict[str, Any]
+) -> PlatformConfig:
+    if config_cls is KubernetesConfig:
+        for key in ("resourceLimits", "resource_limits"):
+            limits = data.get(key)
+            if isinstance(limits, dict):
+                data = {**data, key: ResourceLimits.model_construct(**limits)}
+    return config_cls.model_construct(**data)
+
+
 class Target(BaseModel):
     """Deployment target definition."""
 
@@ -247,11 +521,46 @@ class Target(BaseModel):
     output: str = Field(
         ..., description="Output directory for generated deployment artifacts"
     )
-    config: dict | None = Field(
-        default=None, description="Platform-specific configuration"
+    config: dict[str, Any] | PlatformConfig | None = Field(
+        default=None,
+        union_mode="left_to_right",
+        description=(
+            "Platform-specific configuration, parsed into the config model "
+            "matching the platform when one exists"
+        ),
     )
 
-    model_config = {"use_enum_values": True}
+    model_config = {"use_enum_values": True, "defer_build": True}
+
+    @field_validator("config", mode="before")
+    @classmethod
+    def _parse_config(cls, value: Any, info: ValidationInfo) -> Any:
+        platform = info.data.get("platform", "")
+        config_cls = _PLATFORM_CONFIGS.get(platform)
+        if isinstance(value, dict):
+            if config_cls is None:
+                return value
+            return config_cls.model_validate(value)
+        if isinstance(value, BaseModel) and type(value) is not config_cls:
+            raise ValueError(
+                f"{type(value).__name__} does not match platform {platform!r}"
+            )
+        return value
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> Target:
+        """Build a target from already-validated data without re-validating.
+
+        A dict config is constructed as the platform's config model. Never use
+        this for user-supplied input.
+        """
+        config = data.get("config")
+        if isinstance(config, dict):
+            config_cls = _PLATFORM_CONFIGS.get(data.get("platform", ""))
+            if config_cls is not None:
+                config = _construct_config(config_cls, config)
+                data = {**data, "config": config}
+        return cls.model_construct(**data)
 
 
 class Deployment(BaseModel):
@@ -263,30 +572,150 @@ class Deployment(BaseModel):
         ..., min_length=1, description="List of deployment targets"
     )
 
+    model_config = {"defer_build": True}
+
+    @model_validator(mode="after")
+    def _check_unique_targets(self) -> Deployment:
+        duplicates = _duplicates(target.name for target in self.targets)
+        if duplicates:
+            raise ValueError(f"duplicate target names: {duplicates}")
+        return self
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> Deployment:
+        """Build a deployment from already-validated data without re-validating.
+
+        Nested targets are constructed the same way. Never use this for
+        user-supplied input.
+        """
+        data = dict(data)
+        if "targets" in data:
+            data["targets"] = [
+                Target.from_trusted(t) if isinstance(t, dict) else t
+                for t in data["targets"]
+            ]
+        return cls.model_construct(**data)
+
+
+_MODELS: tuple[type[BaseModel], ...] = (
+    Agent,
+    Step,
+    Workflow,
+    Team,
+    ClaudeCodeConfig,
+    KiroCliConfig,
+    AwsAgentCoreConfig,
+    ResourceLimits,
+    KubernetesConfig,
+    AgentKitLocalConfig,
+    Target,
+    Deployment,
+)
+
+
+def build() -> None:
+    """Build the validators for every model ahead of first use.
+
+    Models defer building their schemas until they are first validated, which
+    keeps ``import multi_agent_spec`` cheap. Long-running services can call
+    this at startup to pay that cost once, up front.
+    """
+    for model in _MODELS:
+        model.model_rebuild()
+
+
+# Pydantic release the packaged deployment schema was generated with. JSON
+# Schema output differs between 2.x releases, so scripts/gen_schema.py refuses
+# to regenerate the file with any other version.
+_SCHEMA_PYDANTIC_VERSION = "2.14.1"
+
+
+@functools.cache
+def deployment_schema() -> bytes:
+    """Return the JSON Schema for :class:`Deployment` as UTF-8 bytes.
+
+    This is the schema of the Pydantic model, which covers a subset of the
+    canonical ``schema/deployment/deployment.schema.json`` generated from the
+    Go types. The file is committed with the package and regenerated by hand
+    with ``make generate-python``, so reading it never touches pydantic-core.
+    """
+    schema = resources.files("multi_agent_spec") / "pydantic-deployment.schema.json"
+    return schema.read_bytes()
+
+
+@functools.cache
+def _agents_adapter() -> TypeAdapter[list[Agent]]:
+    return TypeAdapter(list[Agent])
+
+
+@functools.cache
+def _targets_adapter() -> TypeAdapter[list[Target]]:
+    return TypeAdapter(list[Target])
+
+
+def validate_agents(data: Any) -> list[Agent]:
+    """Validate a list of agent definitions in a single validator call."""
+    return _agents_adapter().validate_python(data)
+
+
+def validate_targets(data: Any) -> list[Target]:
+    """Validate a list of deployment targets in a single validator call."""
+    return _targets_adapter().validate_python(data)
+
+
+@functools.cache
+def _default_config(
+    cls: type[PlatformConfig | ResourceLimits],
+) -> tuple[PlatformConfig | ResourceLimits, bytes]:
+    default = cls()
+    return default, default.model_dump_json(by_alias=True).encode()
+
+
+def dump_config_json(config: PlatformConfig | ResourceLimits) -> bytes:
+    """Serialize a platform config to JSON bytes using its field aliases.
+
+    Every field is written, so the result matches the ``config`` member of
+    ``Target.model_dump_json(by_alias=True)``. Configs left at their defaults
+    are encoded once per class and the cached bytes are reused on every later
+    call.
+
+    Raises:
+        TypeError: If ``config`` is not a platform config or ResourceLimits.
+    """
+    if not isinstance(config, PlatformConfig | ResourceLimits):
+        raise TypeError(f"expected a platform config, got {type(config).__name__}")
+    default, encoded = _default_config(type(config))
+    if config.__dict__ == default.__dict__ and not config.__pydantic_extra__:
+        return encoded
+    return config.model_dump_json(by_alias=True).encode()
+
 
 # =============================================================================
 # Model Mappings
 # =============================================================================
 
-CLAUDE_CODE_MODELS: dict[str, str] = {
+# Mappings are shared, read-only lookup tables; wrap them so callers cannot
+# mutate them in place. The proxies cannot be JSON-encoded, pickled or
+# deep-copied directly; use dict(KIRO_CLI_TOOLS) to get a plain copy.
+CLAUDE_CODE_MODELS: Mapping[str, str] = MappingProxyType({
     "haiku": "haiku",
     "sonnet": "sonnet",
     "opus": "opus",
-}
+})
 
-KIRO_CLI_MODELS: dict[str, str] = {
+KIRO_CLI_MODELS: Mapping[str, str] = MappingProxyType({
     "haiku": "claude-haiku-35",
     "sonnet": "claude-sonnet-4",
     "opus": "claude-opus-4",
-}
+})
 
-BEDROCK_MODELS: dict[str, str] = {
+BEDROCK_MODELS: Mapping[str, str] = MappingProxyType({
     "haiku": "anthropic.claude-3-haiku-20240307-v1:0",
     "sonnet": "anthropic.claude-3-5-sonnet-20241022-v2:0",
     "opus": "anthropic.claude-3-opus-20240229-v1:0",
-}
+})
 
-KIRO_CLI_TOOLS: dict[str, str] = {
+KIRO_CLI_TOOLS: Mapping[str, str] = MappingProxyType({
     "WebSearch": "web_search",
     "WebFetch": "web_fetch",
     "Read": "read",
@@ -296,4 +725,4 @@ KIRO_CLI_TOOLS: dict[str, str] = {
     "Bash": "bash",
     "Edit": "edit",
     "Task": "task",
-}
+})
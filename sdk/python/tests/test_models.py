@@ -1,10 +1,14 @@
 """Tests for multi_agent_spec models."""
 
+import copy
 import json
 
+import pydantic
 import pytest
 from pydantic import ValidationError
 
+import multi_agent_spec
+from multi_agent_spec import models
 from multi_agent_spec import (
     # Enums
     Model,
@@ -32,6 +36,12 @@ from multi_agent_spec import (
     CLAUDE_CODE_MODELS,
     KIRO_CLI_MODELS,
     KIRO_CLI_TOOLS,
+    # Functions
+    build,
+    deployment_schema,
+    dump_config_json,
+    validate_agents,
+    validate_targets,
 )
 
 
@@ -65,6 +75,13 @@ class TestTool:
         assert Tool.READ.value == "Read"
         assert Tool.WRITE.value == "Write"
 
+    def test_tool_is_str(self) -> None:
+        """Test that tools behave as their string values."""
+        assert Tool.READ == "Read"
+        assert str(Tool.READ) == "Read"
+        assert f"{Tool.WEB_SEARCH}" == "WebSearch"
+        assert Tool("Read") is Tool.READ
+
 
 class TestModel:
     """Tests for Model enum."""
@@ -141,9 +158,9 @@ class TestAgent:
         assert agent.name == "test-agent"
         assert agent.description == "A test agent"
         assert agent.model == "sonnet"  # enum converted to value
-        assert agent.tools == ["Read", "Write"]
-        assert agent.skills == ["skill1"]
-        assert agent.dependencies == ["other-agent"]
+        assert agent.tools == ("Read", "Write")
+        assert agent.skills == ("skill1",)
+        assert agent.dependencies == ("other-agent",)
         assert agent.instructions == "You are a test agent."
 
     def test_minimal_agent(self) -> None:
@@ -152,11 +169,26 @@ class TestAgent:
 
         assert agent.name == "minimal"
         assert agent.model == "sonnet"  # default
-        assert agent.tools == []
-        assert agent.skills == []
-        assert agent.dependencies == []
+        assert agent.tools == ()
+        assert agent.skills == ()
+        assert agent.dependencies == ()
         assert agent.instructions is None
 
+    def test_duplicate_tools_removed(self) -> None:
+        """Test that repeated tools are dropped in first-seen order."""
+        agent = Agent(
+            name="dupes",
+            description="Test",
+            tools=["Write", "Read", "Write", "mcp__search"],
+        )
+        assert agent.tools == ("Write", "Read", "mcp__search")
+
+    def test_default_lists_shared(self) -> None:
+        """Test that default agents share the empty tuple."""
+        first = Agent(name="first", description="Test")
+        second = Agent(name="second", description="Test")
+        assert first.tools is second.tools
+
     def test_invalid_agent_name_uppercase(self) -> None:
         """Test that uppercase names are rejected."""
         with pytest.raises(ValidationError):
@@ -172,6 +204,11 @@ class TestAgent:
         with pytest.raises(ValidationError):
             Agent(name="agent_name", description="Test")
 
+    def test_invalid_agent_name_trailing_newline(self) -> None:
+        """Test that a trailing newline does not slip past the pattern."""
+        with pytest.raises(ValidationError):
+            Agent(name="agent\n", description="Test")
+
     def test_agent_json_serialization(self) -> None:
         """Test JSON serialization."""
         agent = Agent(
@@ -198,6 +235,65 @@ class TestAgent:
         assert agent.name == "from-dict"
         assert agent.model == "opus"
 
+    def test_agent_to_json_bytes(self) -> None:
+        """Test that to_json_bytes matches model_dump_json."""
+        agent = Agent(name="test", description="Tëst", tools=["Read"])
+        assert agent.to_json_bytes() == agent.model_dump_json().encode()
+
+    def test_agent_to_json_bytes_without_orjson(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the fallback when orjson is not installed."""
+        monkeypatch.setattr(models, "_orjson", None)
+        agent = Agent(name="test", description="Test")
+        assert agent.to_json_bytes() == agent.model_dump_json().encode()
+
+    def test_agent_from_trusted(self) -> None:
+        """Test round-tripping an agent through from_trusted."""
+        agent = Agent(name="trusted", description="Trusted", tools=["Read"])
+        restored = Agent.from_trusted(agent.model_dump())
+
+        assert restored == agent
+
+    def test_agent_from_trusted_json(self) -> None:
+        """Test from_trusted with data decoded from JSON."""
+        agent = Agent(
+            name="trusted",
+            description="Trusted",
+            tools=["Read", "Write"],
+            skills=["skill1"],
+            dependencies=["other"],
+        )
+        restored = Agent.from_trusted(json.loads(agent.model_dump_json()))
+
+        assert restored == agent
+        assert restored.tools == ("Read", "Write")
+
+    def test_agent_from_trusted_dedupes_tools(self) -> None:
+        """Test that from_trusted drops repeated tools."""
+        restored = Agent.from_trusted(
+            {"name": "trusted", "description": "Trusted", "tools": ["Read", "Read"]}
+        )
+        assert restored.tools == ("Read",)
+
+
+class TestValidateAgents:
+    """Tests for bulk agent validation."""
+
+    def test_validate_agents(self) -> None:
+        """Test validating several agents at once."""
+        agents = validate_agents([
+            {"name": "a1", "description": "First", "tools": ["Read"]},
+            {"name": "a2", "description": "Second", "model": "opus"},
+        ])
+        assert [agent.name for agent in agents] == ["a1", "a2"]
+        assert agents[1].model == "opus"
+
+    def test_validate_agents_invalid(self) -> None:
+        """Test that an invalid entry fails the whole batch."""
+        with pytest.raises(ValidationError):
+            validate_agents([{"name": "Bad", "description": "Bad"}])
+
 
 # =============================================================================
 # Step Tests
@@ -265,6 +361,82 @@ class TestWorkflow:
         assert len(workflow.steps) == 2
         assert workflow.steps[1].depends_on == ["s1"]
 
+    def test_to_soa(self) -> None:
+        """Test converting steps into parallel lists."""
+        workflow = Workflow(
+            steps=[
+                Step(name="s1", agent="a1"),
+                Step(name="s2", agent="a2", depends_on=["s1"]),
+            ],
+        )
+        names, agents, depends_on = workflow.to_soa()
+
+        assert names == ["s1", "s2"]
+        assert agents == ["a1", "a2"]
+        assert depends_on == [None, ["s1"]]
+
+    def test_to_soa_without_steps(self) -> None:
+        """Test converting a workflow with no steps."""
+        assert Workflow().to_soa() == ([], [], [])
+
+    def test_validate_dag_order(self) -> None:
+        """Test that steps are returned in dependency order."""
+        workflow = Workflow(
+            type=WorkflowType.DAG,
+            steps=[
+                Step(name="report", agent="a3", depends_on=["verify", "research"]),
+                Step(name="verify", agent="a2", depends_on=["research"]),
+                Step(name="research", agent="a1"),
+            ],
+        )
+        assert workflow.validate_dag() == ["research", "verify", "report"]
+
+    def test_validate_dag_unknown_dependency(self) -> None:
+        """Test that unknown dependencies are rejected."""
+        workflow = Workflow(steps=[Step(name="s1", agent="a1", depends_on=["s0"])])
+        with pytest.raises(ValueError, match="unknown step"):
+            workflow.validate_dag()
+
+    def test_validate_dag_duplicate_steps(self) -> None:
+        """Test that duplicate step names are rejected."""
+        workflow = Workflow(
+            steps=[
+                Step(name="s1", agent="a1"),
+                Step(name="s1", agent="a2"),
+                Step(name="s2", agent="a3", depends_on=["s1"]),
+            ],
+        )
+        with pytest.raises(ValueError, match="duplicate step names"):
+            workflow.validate_dag()
+
+    def test_validate_dag_cycle(self) -> None:
+        """Test that cycles are rejected."""
+        workflow = Workflow(
+            steps=[
+                Step(name="s1", agent="a1", depends_on=["s2"]),
+                Step(name="s2", agent="a2", depends_on=["s1"]),
+                Step(name="s3", agent="a3"),
+            ],
+        )
+        with pytest.raises(ValueError, match="cycle"):
+            workflow.validate_dag()
+
+    def test_validate_dag_blocked_by_cycle(self) -> None:
+        """Test that steps downstream of a cycle are reported as blocked."""
+        workflow = Workflow(
+            steps=[
+                Step(name="s1", agent="a1", depends_on=["s2"]),
+                Step(name="s2", agent="a2", depends_on=["s1"]),
+                Step(name="s3", agent="a3", depends_on=["s1"]),
+                Step(name="s4", agent="a4"),
+            ],
+        )
+        with pytest.raises(ValueError) as exc_info:
+            workflow.validate_dag()
+        assert str(exc_info.value) == (
+            "steps blocked by a dependency cycle: ['s1', 's2', 's3']"
+        )
+
 
 # =============================================================================
 # Team Tests
@@ -307,11 +479,60 @@ class TestTeam:
         with pytest.raises(ValidationError):
             Team(name="team", version="v1.0.0", agents=["a1"])
 
+    def test_duplicate_agents_rejected(self) -> None:
+        """Test that agent names must be unique."""
+        with pytest.raises(ValidationError, match="duplicate agent names"):
+            Team(name="team", version="1.0.0", agents=["a1", "a2", "a1"])
+
+    def test_duplicate_agents_reported_once(self) -> None:
+        """Test that each duplicated agent name is reported once."""
+        with pytest.raises(ValidationError) as exc_info:
+            Team(name="team", version="1.0.0", agents=["a1", "a1", "a1", "a2"])
+        assert "duplicate agent names: ['a1']" in str(exc_info.value)
+
+    def test_invalid_team_name(self) -> None:
+        """Test that team names follow the identifier pattern."""
+        with pytest.raises(ValidationError):
+            Team(name="Team", version="1.0.0", agents=["a1"])
+
     def test_empty_agents_rejected(self) -> None:
         """Test that empty agents list is rejected."""
         with pytest.raises(ValidationError):
             Team(name="team", version="1.0.0", agents=[])
 
+    def test_team_to_json_bytes(self) -> None:
+        """Test that to_json_bytes matches model_dump_json for nested steps."""
+        team = Team(
+            name="team",
+            version="1.0.0",
+            agents=["a1"],
+            workflow=Workflow(
+                steps=[Step(name="s1", agent="a1", inputs={"topic": "x"})],
+            ),
+        )
+        assert team.to_json_bytes() == team.model_dump_json().encode()
+
+    def test_team_from_trusted(self) -> None:
+        """Test that from_trusted rebuilds nested workflow steps."""
+        team = Team(
+            name="team",
+            version="1.0.0",
+            agents=["a1", "a2"],
+            workflow=Workflow(
+                type=WorkflowType.DAG,
+                steps=[
+                    Step(name="s1", agent="a1"),
+                    Step(name="s2", agent="a2", depends_on=["s1"]),
+                ],
+            ),
+        )
+        restored = Team.from_trusted(team.model_dump())
+
+        assert restored == team
+        assert restored.workflow is not None
+        assert restored.workflow.steps is not None
+        assert isinstance(restored.workflow.steps[1], Step)
+
 
 # =============================================================================
 # Config Tests
@@ -332,6 +553,17 @@ class TestClaudeCodeConfig:
         config = ClaudeCodeConfig(agentDir="custom/path")
         assert config.agent_dir == "custom/path"
 
+    def test_format_is_frozen(self) -> None:
+        """Test that format cannot be reassigned."""
+        config = ClaudeCodeConfig()
+        with pytest.raises(ValidationError):
+            config.format = "json"
+
+    def test_wrong_format_rejected(self) -> None:
+        """Test that only the markdown format is accepted."""
+        with pytest.raises(ValidationError):
+            ClaudeCodeConfig(format="anything")
+
 
 class TestKiroCliConfig:
     """Tests for KiroCliConfig."""
@@ -342,6 +574,11 @@ class TestKiroCliConfig:
         assert config.plugin_dir == "plugins/kiro/agents"
         assert config.format == "json"
 
+    def test_wrong_format_rejected(self) -> None:
+        """Test that only the json format is accepted."""
+        with pytest.raises(ValidationError):
+            KiroCliConfig(format="markdown")
+
 
 class TestAwsAgentCoreConfig:
     """Tests for AwsAgentCoreConfig."""
@@ -414,6 +651,43 @@ class TestAgentKitLocalConfig:
         assert config.port == 8080
 
 
+class TestDumpConfigJson:
+    """Tests for cached config serialization."""
+
+    def test_default_config(self) -> None:
+        """Test that default configs reuse the cached encoding."""
+        first = dump_config_json(ClaudeCodeConfig())
+        assert json.loads(first) == {"agentDir": ".claude/agents", "format": "markdown"}
+        assert dump_config_json(ClaudeCodeConfig()) is first
+
+    def test_custom_config(self) -> None:
+        """Test that non-default configs are encoded directly."""
+        data = json.loads(dump_config_json(ResourceLimits(cpu="1000m")))
+        assert data == {"cpu": "1000m", "memory": "512Mi"}
+
+    def test_config_with_extra_keys(self) -> None:
+        """Test that extra keys are not hidden by the default cache."""
+        data = json.loads(dump_config_json(ResourceLimits(gpu="1")))
+        assert data == {"cpu": "500m", "memory": "512Mi", "gpu": "1"}
+
+    def test_matches_target_dump(self) -> None:
+        """Test that the encoding matches a target's aliased JSON dump."""
+        target = Target(
+            name="k8s",
+            platform=Platform.KUBERNETES,
+            output="helm",
+            config={"namespace": "n"},
+        )
+        assert target.config is not None
+        dumped = json.loads(target.model_dump_json(by_alias=True))
+        assert json.loads(dump_config_json(target.config)) == dumped["config"]
+
+    def test_non_config_rejected(self) -> None:
+        """Test that models other than configs are rejected."""
+        with pytest.raises(TypeError):
+            dump_config_json(Agent(name="a", description="A"))  # type: ignore[arg-type]
+
+
 # =============================================================================
 # Target Tests
 # =============================================================================
@@ -445,14 +719,125 @@ class TestTarget:
         assert target.priority == "p2"
 
     def test_with_config(self) -> None:
-        """Test target with config."""
+        """Test that config is parsed into the platform's config model."""
         target = Target(
             name="test",
             platform=Platform.AWS_AGENTCORE,
             output="cdk",
             config={"region": "us-west-2"},
         )
-        assert target.config == {"region": "us-west-2"}
+        assert isinstance(target.config, AwsAgentCoreConfig)
+        assert target.config.region == "us-west-2"
+
+    def test_with_kubernetes_config(self) -> None:
+        """Test that Kubernetes-based platforms share KubernetesConfig."""
+        target = Target.model_validate({
+            "name": "eks",
+            "platform": "aws-eks",
+            "output": "helm",
+            "config": {"namespace": "agents", "resourceLimits": {"cpu": "1"}},
+        })
+        assert isinstance(target.config, KubernetesConfig)
+        assert target.config.resource_limits == ResourceLimits(cpu="1")
+
+    def test_invalid_config_rejected(self) -> None:
+        """Test that config values are validated against the platform."""
+        with pytest.raises(ValidationError):
+            Target(
+                name="test",
+                platform=Platform.AGENTKIT_LOCAL,
+                output="out",
+                config={"transport": "tcp"},
+            )
+
+    def test_config_round_trip(self) -> None:
+        """Test that configs survive a default dump and parse."""
+        target = Target(
+            name="test",
+            platform=Platform.CLAUDE_CODE,
+            output="out",
+            config={"agentDir": "custom"},
+        )
+        restored = Target.model_validate_json(target.model_dump_json())
+
+        assert restored == target
+        assert isinstance(restored.config, ClaudeCodeConfig)
+        assert restored.config.agent_dir == "custom"
+
+    def test_config_dump_follows_options(self) -> None:
+        """Test that config dumps honour the caller's serialization options."""
+        target = Target(
+            name="test",
+            platform=Platform.CLAUDE_CODE,
+            output="out",
+            config={"agentDir": "custom"},
+        )
+        assert target.model_dump()["config"] == {
+            "agent_dir": "custom",
+            "format": "markdown",
+        }
+        dumped = target.model_dump(by_alias=True, exclude_unset=True)
+        assert dumped["config"] == {"agentDir": "custom"}
+
+    def test_config_accepts_field_names(self) -> None:
+        """Test that configs accept snake_case field names."""
+        target = Target(
+            name="test",
+            platform=Platform.KIRO_CLI,
+            output="out",
+            config={"plugin_dir": "custom"},
+        )
+        assert isinstance(target.config, KiroCliConfig)
+        assert target.config.plugin_dir == "custom"
+
+    def test_config_keeps_unknown_keys(self) -> None:
+        """Test that keys without a config field are preserved."""
+        config = {"namespace": "n", "replicas": 3}
+        target = Target(
+            name="test",
+            platform=Platform.KUBERNETES,
+            output="out",
+            config=config,
+        )
+        assert target.model_dump(exclude_unset=True)["config"] == config
+        assert Target.model_validate(target.model_dump()) == target
+
+    def test_mismatched_config_rejected(self) -> None:
+        """Test that a config model must match the platform."""
+        with pytest.raises(ValidationError, match="does not match platform"):
+            Target(
+                name="test",
+                platform=Platform.CLAUDE_CODE,
+                output="out",
+                config=KiroCliConfig(),
+            )
+
+    def test_untyped_platform_config(self) -> None:
+        """Test that platforms without a config model keep a plain dict."""
+        target = Target(
+            name="compose",
+            platform=Platform.DOCKER_COMPOSE,
+            output="compose",
+            config={"file": "docker-compose.yaml"},
+        )
+        assert target.config == {"file": "docker-compose.yaml"}
+
+
+class TestValidateTargets:
+    """Tests for bulk target validation."""
+
+    def test_validate_targets(self) -> None:
+        """Test validating several targets at once."""
+        targets = validate_targets([
+            {"name": "t1", "platform": "claude-code", "output": "out"},
+            {
+                "name": "t2",
+                "platform": "agentkit-local",
+                "output": "out",
+                "config": {"transport": "http", "port": 8080},
+            },
+        ])
+        assert isinstance(targets[1].config, AgentKitLocalConfig)
 
 
 # =============================================================================
@@ -484,6 +869,17 @@ class TestDeployment:
         with pytest.raises(ValidationError):
             Deployment(team="test", targets=[])
 
+    def test_duplicate_targets_rejected(self) -> None:
+        """Test that target names must be unique."""
+        with pytest.raises(ValidationError, match="duplicate target names"):
+            Deployment.model_validate({
+                "team": "test",
+                "targets": [
+                    {"name": "t", "platform": "claude-code", "output": "a"},
+                    {"name": "t", "platform": "kiro-cli", "output": "b"},
+                ],
+            })
+
     def test_with_schema(self) -> None:
         """Test deployment with $schema field."""
         deployment = Deployment.model_validate({
@@ -495,6 +891,77 @@ class TestDeployment:
         })
         assert deployment.schema_ == "../schema/deployment.schema.json"
 
+    def test_from_trusted(self) -> None:
+        """Test that from_trusted rebuilds nested targets."""
+        deployment = Deployment.model_validate({
+            "$schema": "../schema/deployment.schema.json",
+            "team": "test",
+            "targets": [
+                {"name": "t", "platform": "claude-code", "output": "out"}
+            ],
+        })
+        restored = Deployment.from_trusted(deployment.model_dump(by_alias=True))
+
+        assert restored == deployment
+        assert isinstance(restored.targets[0], Target)
+
+    def test_json_round_trip_keeps_config(self) -> None:
+        """Test that a JSON dump and parse keeps custom config values."""
+        deployment = Deployment(
+            team="test",
+            targets=[
+                Target(
+                    name="t",
+                    platform=Platform.CLAUDE_CODE,
+                    output="out",
+                    config={"agentDir": "custom"},
+                )
+            ],
+        )
+        restored = Deployment.model_validate_json(deployment.model_dump_json())
+
+        assert restored == deployment
+        config = restored.targets[0].config
+        assert isinstance(config, ClaudeCodeConfig)
+        assert config.agent_dir == "custom"
+
+    def test_from_trusted_config(self) -> None:
+        """Test that from_trusted builds typed platform configs."""
+        deployment = Deployment.model_validate({
+            "team": "test",
+            "targets": [
+                {
+                    "name": "eks",
+                    "platform": "aws-eks",
+                    "output": "helm",
+                    "config": {"resourceLimits": {"cpu": "1", "memory": "1Gi"}},
+                }
+            ],
+        })
+        restored = Deployment.from_trusted(deployment.model_dump(by_alias=True))
+
+        assert restored == deployment
+        config = restored.targets[0].config
+        assert isinstance(config, KubernetesConfig)
+        assert isinstance(config.resource_limits, ResourceLimits)
+
+
+class TestDeploymentSchema:
+    """Tests for the packaged deployment schema."""
+
+    def test_matches_model(self) -> None:
+        """Test that the packaged schema is up to date with Deployment.
+
+        Regenerate it with ``make generate-python`` if this fails. Skipped
+        when the installed pydantic differs from the one the file was
+        generated with, since schema output changes between releases.
+        """
+        if pydantic.VERSION != models._SCHEMA_PYDANTIC_VERSION:
+            pytest.skip(
+                f"schema generated with pydantic {models._SCHEMA_PYDANTIC_VERSION}"
+            )
+        assert json.loads(deployment_schema()) == Deployment.model_json_schema()
+
 
 # =============================================================================
 # Mapping Tests
@@ -534,6 +1001,23 @@ class TestMappings:
         assert KIRO_CLI_TOOLS["Edit"] == "edit"
         assert KIRO_CLI_TOOLS["Task"] == "task"
 
+    def test_mappings_are_read_only(self) -> None:
+        """Test that shared mappings cannot be mutated."""
+        for mapping in (
+            CLAUDE_CODE_MODELS,
+            KIRO_CLI_MODELS,
+            BEDROCK_MODELS,
+            KIRO_CLI_TOOLS,
+        ):
+            with pytest.raises(TypeError):
+                mapping["new"] = "value"  # type: ignore[index]
+
+    def test_mappings_serialize_as_dicts(self) -> None:
+        """Test that plain dict copies of the mappings serialize."""
+        data = json.loads(json.dumps(dict(KIRO_CLI_TOOLS)))
+        assert data["Read"] == "read"
+        assert dict(BEDROCK_MODELS) == copy.deepcopy(dict(BEDROCK_MODELS))
+
 
 # =============================================================================
 # Version Tests
@@ -547,3 +1031,32 @@ class TestVersion:
         """Test that version is defined."""
         from multi_agent_spec import __version__
         assert __version__ == "1.0.0"
+
+
+# =============================================================================
+# Package Tests
+# =============================================================================
+
+
+class TestBuild:
+    """Tests for deferred model building."""
+
+    def test_build_completes_models(self) -> None:
+        """Test that build() leaves every model ready for validation."""
+        build()
+        for model in (Agent, Team, Deployment, Target, KubernetesConfig):
+            assert model.__pydantic_complete__
+
+
+class TestLazyExports:
+    """Tests for lazily resolved package exports."""
+
+    def test_all_exports_resolve(self) -> None:
+        """Test that every name in __all__ can be imported."""
+        for name in multi_agent_spec.__all__:
+            assert getattr(multi_agent_spec, name) is not None
+
+    def test_unknown_attribute(self) -> None:
+        """Test that unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            multi_agent_spec.NotAModel  # noqa: B018